@@ -3,22 +3,23 @@
 
 from __future__ import annotations
 
-import json
+import os
 import pathlib
-from typing import Match, Pattern
+import sys
+from functools import lru_cache
+from typing import Any, Match, Pattern
 
 import click
 
-import papis.cli
 import papis.config
 import papis.document
-import papis.logging
-import papis.strings
+import papis.format
 from papis_uefiscdi.config import (
     INDEX_DISPLAY_NAME,
     UEFISCDI_DATABASE_URL,
     UEFISCDI_DEFAULT_PASSWORD,
     UEFISCDI_DEFAULT_VERSION,
+    UEFISCDI_SUPPORTED_DATABASE_NAMES,
     UEFISCDI_SUPPORTED_DATABASES,
 )
 from papis_uefiscdi.logging import get_logger
@@ -28,6 +29,15 @@ log = get_logger(__name__)
 
 # {{{ utils
 
+UEFISCDI_MATCH_FORMAT = "{doc[title]}{doc[author]}"
+"""Format used to match search queries against the journal documents."""
+
+UEFISCDI_PARALLEL_SEARCH_THRESHOLD = 50_000
+"""Minimum number of documents for which the search is done in parallel."""
+
+UEFISCDI_MMAP_THRESHOLD = 64 * 1024
+"""Minimum size (in bytes) of a database file that is loaded through :mod:`mmap`."""
+
 papis.config.register_default_settings({
     "uefiscdi": {
         "version": UEFISCDI_DEFAULT_VERSION,
@@ -46,6 +56,38 @@ def get_uefiscdi_database_path(database: str, version: int) -> pathlib.Path:
     return config_dir / "uefiscdi" / str(version) / f"{database}.json"
 
 
+@lru_cache(maxsize=16)
+def _read_uefiscdi_database(filename: pathlib.Path, mtime_ns: int) -> dict[str, Any]:
+    # NOTE: *mtime_ns* is only part of the cache key, so that a database that
+    # was re-indexed in the meantime is read again. The cached result is shared
+    # between callers, so the entries are stored in an immutable tuple.
+
+    import orjson
+
+    with open(filename, "rb") as inf:
+        if os.fstat(inf.fileno()).st_size < UEFISCDI_MMAP_THRESHOLD:
+            db: dict[str, Any] = orjson.loads(inf.read())
+        else:
+            import mmap
+
+            # NOTE: this avoids copying the whole file into a bytes object
+            # before parsing it, which adds up for the larger databases
+            mm = mmap.mmap(inf.fileno(), 0, access=mmap.ACCESS_READ)
+            with mm, memoryview(mm) as buf:
+                db = orjson.loads(buf)
+
+    # NOTE: these fields only take a few hundred distinct values, so interning
+    # them saves memory and makes the comparisons in `cli_search` cheaper
+    for entry in db["entries"]:
+        for key in ("category", "index", "quartile"):
+            value = entry.get(key)
+            if value is not None:
+                entry[key] = sys.intern(value)
+
+    db["entries"] = tuple(db["entries"])
+    return db
+
+
 def load_uefiscdi_database(database: str, version: int | None = None) -> Database:
     if version is None:
         version = papis.config.getint("version", section="uefiscdi")
@@ -59,9 +101,7 @@ def load_uefiscdi_database(database: str, version: int | None = None) -> Databas
         return Database(id=database, version=version, url="", entries=[])
 
     log.info("Database loaded from '%s'.", filename)
-
-    with open(filename, encoding="utf-8") as inf:
-        db = json.load(inf)
+    db = _read_uefiscdi_database(filename, filename.stat().st_mtime_ns)
 
     return Database(id=database, version=version, url=db["url"], entries=db["entries"])
 
@@ -72,12 +112,13 @@ def index_uefiscdi_database(
     overwrite: bool = False,
     password: str | None = None,
     version: int | None = None,
+    parallel: bool = True,
 ) -> None:
     if database not in UEFISCDI_SUPPORTED_DATABASES:
         log.error(
             "Unknown database '%s'. Supported databases are '%s'.",
             database,
-            "', '".join(UEFISCDI_SUPPORTED_DATABASES),
+            "', '".join(UEFISCDI_SUPPORTED_DATABASE_NAMES),
         )
         return
 
@@ -108,7 +149,7 @@ def index_uefiscdi_database(
 
     try:
         db = parse_uefiscdi_database_from_url(
-            database, url, password=password, version=version
+            database, url, password=password, version=version, parallel=parallel
         )
     except Exception as exc:
         log.error(
@@ -116,11 +157,23 @@ def index_uefiscdi_database(
         )
         return
 
-    if not filename.parent.exists():
-        filename.parent.mkdir()
+    filename.parent.mkdir(parents=True, exist_ok=True)
+
+    import orjson
 
-    with open(filename, "w", encoding="utf-8") as outf:
-        json.dump(db, outf, indent=2, sort_keys=False)
+    data = orjson.dumps(db, option=orjson.OPT_INDENT_2)
+
+    # NOTE: write to a temporary file first and atomically move it in place, so
+    # that an interrupted index does not leave behind a truncated database
+    tmpfile = filename.with_suffix(".json.tmp")
+    try:
+        with open(tmpfile, "wb") as outf:
+            outf.write(data)
+
+        os.replace(tmpfile, filename)
+    except BaseException:
+        tmpfile.unlink(missing_ok=True)
+        raise
 
     log.info("Database saved in '%s'.", filename)
 
@@ -137,21 +190,15 @@ def to_dummy_document(
     # with other pickers as well
 
     quartile = entry["quartile"] or "N/A"
-    score = entry["score"] or "N/A"
-    if score != "N/A":
-        score = f"{score:.3f}"
+    score = f"{s:.3f}" if (s := entry["score"]) else "N/A"
+    category = entry["category"] or "unknown"
+    cindex = entry["index"] or "unknown"
 
     return papis.document.from_data({
         # NOTE: used to retrieve original entry
         "_id": index,
-        "title": "[{}] {}".format(
-            entry["issn"] or entry["eissn"],
-            entry["name"],
-        ),
-        "author": "Category: {} | Index: {}".format(
-            entry["category"] or "unknown",
-            entry["index"] or "unknown",
-        ),
+        "title": f"[{entry['issn'] or entry['eissn']}] {entry['name']}",
+        "author": f"Category: {category} | Index: {cindex}",
         "tags": f"{name.upper()} Score {score} | Quartile {quartile}",
         "year": version,
         **entry,
@@ -164,9 +211,13 @@ def match_journal(
     match_format: str | None = None,
     doc_key: str | None = None,
 ) -> Match[str] | None:
-    match_format = match_format or "{doc[title]}{doc[author]}"
+    match_format = match_format or UEFISCDI_MATCH_FORMAT
     if doc_key is not None:
         match_string = str(document[doc_key])
+    elif match_format == UEFISCDI_MATCH_FORMAT:
+        # NOTE: this is called for every document, so skip going through the
+        # papis formatter for the default format
+        match_string = f"{document['title']}{document['author']}"
     else:
         match_string = papis.format.format(match_format, document)
 
@@ -214,7 +265,7 @@ def cli(list_databases: bool) -> None:
 @click.option(
     "-d",
     "--database",
-    type=click.Choice(list(UEFISCDI_SUPPORTED_DATABASES), case_sensitive=False),
+    type=click.Choice(UEFISCDI_SUPPORTED_DATABASE_NAMES, case_sensitive=False),
     help="Name of the database to update (all by default)",
 )
 @click.option(
@@ -246,18 +297,35 @@ def cli_index(
 ) -> None:
     """Download and parse UEFISCDI databases"""
     if version is None:
-        version = papis.config.get("version", section="uefiscdi")
+        version = papis.config.getint("version", section="uefiscdi")
 
     if password is None:
         password = papis.config.get("password", section="uefiscdi")
 
-    databases = (
-        UEFISCDI_SUPPORTED_DATABASES if database is None else frozenset([database])
-    )
-    for name in databases:
-        index_uefiscdi_database(
-            name, overwrite=overwrite, password=password, version=version
-        )
+    databases = UEFISCDI_SUPPORTED_DATABASE_NAMES if database is None else (database,)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # NOTE: the databases are independent, so they are downloaded and parsed
+    # concurrently, which mostly helps with overlapping the slow downloads. The
+    # PDFs are only parsed in parallel for a single database, so that several
+    # process pools are not started at the same time.
+    parallel = len(databases) == 1
+    with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+        futures = [
+            executor.submit(
+                index_uefiscdi_database,
+                name,
+                overwrite=overwrite,
+                password=password,
+                version=version,
+                parallel=parallel,
+            )
+            for name in databases
+        ]
+
+        for future in futures:
+            future.result()
 
 
 # }}}
@@ -272,7 +340,7 @@ def cli_index(
 @click.option(
     "-d",
     "--database",
-    type=click.Choice(list(UEFISCDI_SUPPORTED_DATABASES), case_sensitive=False),
+    type=click.Choice(UEFISCDI_SUPPORTED_DATABASE_NAMES, case_sensitive=False),
     default="ais",
     help="Database to search for scores",
 )
@@ -291,14 +359,14 @@ def cli_index(
 @click.option(
     "-i",
     "--index",
-    type=click.Choice(list(INDEX_DISPLAY_NAME), case_sensitive=False),
+    type=click.Choice(tuple(INDEX_DISPLAY_NAME), case_sensitive=False),
     help="Web of Science citation index identifier",
 )
 @click.option(
     "-q",
     "--quartile",
     default=None,
-    type=int,
+    type=click.IntRange(1, 4),
     help="Minimum quartile to display",
 )
 @click.option(
@@ -329,27 +397,47 @@ def cli_search(
     """Search UEFISCDI databases"""
 
     if year is None:
-        year = papis.config.get("version", section="uefiscdi")
+        year = papis.config.getint("version", section="uefiscdi")
 
     if category is not None:
-        category = category.lower()
+        category = category.casefold()
 
     if index is not None:
-        index = index.lower()
+        # NOTE: the index is always stored in uppercase by the parsers
+        index = index.upper()
+
+    # NOTE: quartiles are stored as 'QX' with a single digit, so they can be
+    # compared directly as strings
+    max_quartile = f"Q{quartile}" if quartile is not None else None
 
     assert year is not None
 
+    # NOTE: there are only a few hundred distinct categories, so the result of
+    # the (case-insensitive) substring check is cached for each of them
+    category_matches: dict[str, bool] = {}
+
     def match(entry: Entry) -> bool:
-        e_category = entry.get("category")
-        in_category = not category or (e_category and category in e_category.lower())
+        if category:
+            e_category = entry.get("category")
+            if not e_category:
+                return False
+
+            found = category_matches.get(e_category)
+            if found is None:
+                found = category_matches[e_category] = category in e_category.casefold()
+
+            if not found:
+                return False
 
-        e_index = entry.get("index")
-        in_index = not index or (e_index and index == e_index.lower())
+        if index and entry.get("index") != index:
+            return False
 
-        e_quartile = entry.get("quartile")
-        in_quartile = not quartile or (not e_quartile or quartile >= int(e_quartile[1]))
+        if max_quartile:
+            e_quartile = entry.get("quartile")
+            if e_quartile and e_quartile > max_quartile:
+                return False
 
-        return bool(in_category and in_index and in_quartile)
+        return True
 
     db = load_uefiscdi_database(database, year)
     docs = [
@@ -358,20 +446,36 @@ def cli_search(
         if match(entry)
     ]
 
-    from papis.docmatcher import DocMatcher
-
-    DocMatcher.match_format = "{doc[title]}{doc[author]}"
-    DocMatcher.set_search(query)
-    DocMatcher.set_matcher(match_journal)
-    DocMatcher.parse()
-
-    from papis.utils import parmap
-
     if query == ".":
+        # NOTE: the default query matches everything, so skip setting up the
+        # matcher (and the per-document regex matching) altogether
         filtered_docs = docs
     else:
-        result = parmap(DocMatcher.return_if_match, docs)
-        filtered_docs = [e for e in result if e is not None]
+        from papis.docmatcher import DocMatcher
+
+        DocMatcher.set_search(query)
+        DocMatcher.set_matcher(match_journal)
+        DocMatcher.parse()
+
+        # NOTE: `parse` resets the format to the user's 'match-format', which
+        # is meant for library documents, so this needs to be set afterwards
+        DocMatcher.match_format = UEFISCDI_MATCH_FORMAT
+
+        if len(docs) < UEFISCDI_PARALLEL_SEARCH_THRESHOLD:
+            # NOTE: matching a document is just a regex match, so it is a lot
+            # cheaper to do it here than to send all the documents to other
+            # processes for the usual database sizes
+            filtered_docs = [
+                doc for doc in docs if DocMatcher.return_if_match(doc) is not None
+            ]
+        else:
+            from papis.utils import parmap
+
+            filtered_docs = [
+                doc
+                for doc in parmap(DocMatcher.return_if_match, docs)
+                if doc is not None
+            ]
 
     from papis.pick import pick_doc
 
@@ -383,11 +487,17 @@ def cli_search(
             assert isinstance(field, (str, float, int))
             return field
 
-    filtered_docs = sorted(filtered_docs, key=key_func, reverse=sort_reverse)
-    filtered_docs = [entry for entry in pick_doc(filtered_docs) if entry]
-    filtered_entries = [db["entries"][d["_id"]] for d in filtered_docs]
+    filtered_docs.sort(key=key_func, reverse=sort_reverse)
+    filtered_entries = [db["entries"][d["_id"]] for d in pick_doc(filtered_docs) if d]
+
+    import orjson
 
-    click.echo(json.dumps(filtered_entries, indent=2, sort_keys=True))
+    # NOTE: click writes bytes directly to the binary stdout
+    click.echo(
+        orjson.dumps(
+            filtered_entries, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        )
+    )
 
 
 # }}}
@@ -401,7 +511,7 @@ def cli_search(
 @click.option(
     "-d",
     "--database",
-    type=click.Choice(list(UEFISCDI_SUPPORTED_DATABASES), case_sensitive=False),
+    type=click.Choice(UEFISCDI_SUPPORTED_DATABASE_NAMES, case_sensitive=False),
     default="ais",
     help="Database to search for scores",
 )
@@ -16,6 +16,11 @@ full names.
 UEFISCDI_SUPPORTED_DATABASES = frozenset({"aisq", "jifq", "ais", "ris", "rif"})
 """A set of known names for UEFISCDI databases. These are internal identifiers."""
 
+UEFISCDI_SUPPORTED_DATABASE_NAMES = tuple(sorted(UEFISCDI_SUPPORTED_DATABASES))
+"""A sorted :class:`tuple` of :data:`UEFISCDI_SUPPORTED_DATABASES`, used where a
+stable order is needed (e.g. when listing the choices in the command-line).
+"""
+
 UEFISCDI_DATABASE_DISPLAY_NAME = {
     "aisq": "Article Influence Score (Quartiles)",
     "jifq": "Journal Impact Factor (Quartiles)",
@@ -3,14 +3,17 @@
 
 from __future__ import annotations
 
+import io
+import pathlib
 import re
+import sys
 from dataclasses import dataclass
 from typing import Any
 
 import pypdf
 
 from papis_uefiscdi.logging import get_logger
-from papis_uefiscdi.uefiscdi import Entry
+from papis_uefiscdi.uefiscdi import Entry, titlecase
 
 log = get_logger(__name__)
 
@@ -18,7 +21,7 @@ log = get_logger(__name__)
 # {{{ extract_text
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PositionedText:
     text: str
     """Text extracted from the PDF."""
@@ -62,13 +65,21 @@ def extract_text(page: pypdf.PageObject) -> list[PositionedText]:
 
 # {{{ parse_2024_quartile_zone_entries
 
-_ISSN_RE = re.compile(r"\d{4}-\d{3}[\dxX]|N/A")
-_LINE_2024_RE = re.compile(
+# NOTE: every row contains a citation index, so this is used as a cheap check
+# before running the (much more expensive) row regexes
+_INDEX_RE = re.compile(r"AHCI|ESCI|SCIE|SSCI")
+_LINE_2024_PREFIX = (
     r"([\(\)\w &\-]+?)\s?"  # journal name
     r"(\d{4}-\d{3}[\dxX]|N/A) (\d{4}-\d{3}[\dxX]|N/A)\s?"  # issn | eissn
     r"([\w &,\-]+?)\s?(AHCI|ESCI|SCIE|SSCI) "  # category | index
-    r"(Q[1234]|N/A) (Q[1234]|N/A)"  # JIF | AIS quartile
 )
+# NOTE: only the requested quartile is captured, so that it is always group 5
+_LINE_2024_RE = {
+    "jif": re.compile(rf"{_LINE_2024_PREFIX}(Q[1234]|N/A) (?:Q[1234]|N/A)"),
+    "ais": re.compile(rf"{_LINE_2024_PREFIX}(?:Q[1234]|N/A) (Q[1234]|N/A)"),
+}
+# NOTE: a row always ends in a quartile, so a line without one cannot complete it
+_LINE_END_2024_RE = re.compile(r"Q[1234]|N/A")
 
 # NOTE: the case should match the PDF here
 HEADER_NAMES_2024 = (
@@ -90,29 +101,25 @@ def parse_2024_quartile_zone_entries(lines: list[str], fmt: str = "jif") -> list
     This is not always what we get in *line*, since it some rows are spread over
     multiple lines.
     """
-    from titlecase import titlecase
-
     if fmt not in {"ais", "jif"}:
         raise ValueError(f"Unsupported 'fmt': {fmt}")
 
-    quartile_index = 5 if fmt == "jif" else 6
+    line_re = _LINE_2024_RE[fmt]
 
     def row2entry(group: tuple[str, ...]) -> Entry:
-        group = tuple(entry.strip() for entry in group)
-        return Entry(
-            category=titlecase(group[3].strip()),
-            index=group[4].upper(),
-            name=titlecase(group[0].strip()),
-            issn=None if group[1] == "N/A" else group[1].upper(),
-            eissn=None if group[2] == "N/A" else group[2].upper(),
-            quartile=(
-                None
-                if group[quartile_index] == "N/A"
-                else group[quartile_index].upper()
-            ),
-            position=-1,
-            score=None,
-        )
+        # NOTE: only the free text groups can pick up surrounding whitespace,
+        # the others are fixed tokens. The index and quartile only take a few
+        # values, so they are interned to share them across all the entries
+        return {
+            "category": titlecase(group[3].strip()),
+            "index": sys.intern(group[4].upper()),
+            "name": titlecase(group[0].strip()),
+            "issn": None if group[1] == "N/A" else group[1].upper(),
+            "eissn": None if group[2] == "N/A" else group[2].upper(),
+            "quartile": (None if group[5] == "N/A" else sys.intern(group[5].upper())),
+            "position": -1,
+            "score": None,
+        }
 
     # find header location (and hope it's not glued to anything)
     offset = 0
@@ -122,18 +129,25 @@ def parse_2024_quartile_zone_entries(lines: list[str], fmt: str = "jif") -> list
             break
 
     entries = []
-    row = ""
+    parts: list[str] = []
 
     for line in lines[offset:-1]:
-        row = f"{row} {line}"
+        parts.append(line)
+        if not _LINE_END_2024_RE.search(line):
+            continue
+
+        row = " ".join(parts)
+        if not _INDEX_RE.search(row):
+            continue
 
-        new_entries = []
-        for match in _LINE_2024_RE.finditer(row):
-            new_entries.append(row2entry(match.groups()))
+        end = 0
+        for match in line_re.finditer(row):
+            entries.append(row2entry(match.groups()))
+            end = match.end()
 
-        if new_entries:
-            row = ""
-            entries.extend(new_entries)
+        if end:
+            # NOTE: any text after the last match is the start of the next row
+            parts = [tail] if (tail := row[end:].strip()) else []
 
     if not entries:
         raise RuntimeError("No journals found on page")
@@ -164,16 +178,19 @@ HEADER_AIS_NAMES_2023 = (
     "Loc in zona/Q AIS",
 )
 
-_HEADER_FRAGMENTS_2023 = (
-    re.compile(r"Web of Science Category-Index"),
-    re.compile(r"Revista"),
-    re.compile(r"ISSN"),
-    re.compile(r"eISSN"),
-    re.compile(r"Q (JIF|AIS) 2022"),
-    re.compile(r"conform JCR"),
-    re.compile(r"iunie 2023"),
-    re.compile(r"Loc in zona"),
-    re.compile(r"Q (JIF|AIS)"),
+# NOTE: matches any fragment of the header, which is split over several lines
+_HEADER_2023_RE = re.compile(
+    "|".join((
+        r"Web of Science Category-Index",
+        r"Revista",
+        r"ISSN",
+        r"eISSN",
+        r"Q (JIF|AIS) 2022",
+        r"conform JCR",
+        r"iunie 2023",
+        r"Loc in zona",
+        r"Q (JIF|AIS)",
+    ))
 )
 _LINE_2023_RE = re.compile(
     r"([\w &,\-]+) - (AHCI|ESCI|SCIE|SSCI)\s?"  # category | index
@@ -181,6 +198,8 @@ _LINE_2023_RE = re.compile(
     r"(\d{4}-\d{3}[\dxX]|N/A) (\d{4}-\d{3}[\dxX]|N/A)\s?"  # issn | eissn
     r"(Q[1234]|N/A) (\d+)"  # quartile | position
 )
+# NOTE: a row always ends in a position, so a line without one cannot complete it
+_LINE_END_2023_RE = re.compile(r"\d")
 
 
 def parse_2023_quartile_zone_entries(lines: list[str], fmt: str = "jif") -> list[Entry]:
@@ -191,29 +210,26 @@ def parse_2023_quartile_zone_entries(lines: list[str], fmt: str = "jif") -> list
     This is not always what we get in *line*, since it some rows are spread over
     multiple lines.
     """
-    from titlecase import titlecase
-
     if fmt not in {"ais", "jif"}:
         raise ValueError(f"Unsupported 'fmt': {fmt}")
 
     def row2entry(group: tuple[str, ...]) -> Entry:
-        group = tuple(entry.strip() for entry in group)
-        return Entry(
-            category=titlecase(group[0]),
-            index=group[1].upper(),
-            name=titlecase(group[2]),
-            issn=None if group[3] == "N/A" else group[3].upper(),
-            eissn=None if group[4] == "N/A" else group[4].upper(),
-            quartile=(None if group[5] == "N/A" else group[5].upper()),
-            position=int(group[6]),
-            score=None,
-        )
+        return {
+            "category": titlecase(group[0].strip()),
+            "index": sys.intern(group[1].upper()),
+            "name": titlecase(group[2].strip()),
+            "issn": None if group[3] == "N/A" else group[3].upper(),
+            "eissn": None if group[4] == "N/A" else group[4].upper(),
+            "quartile": (None if group[5] == "N/A" else sys.intern(group[5].upper())),
+            "position": int(group[6]),
+            "score": None,
+        }
 
     # find header location (and hope it's not glued to anything)
     offset = 0
     is_on_line = is_on_prev_line = False
     for i, line in enumerate(lines):
-        is_on_line = any(regex.search(line) for regex in _HEADER_FRAGMENTS_2023)
+        is_on_line = _HEADER_2023_RE.search(line) is not None
         if not is_on_line and is_on_prev_line:
             offset = i
             break
@@ -221,18 +237,25 @@ def parse_2023_quartile_zone_entries(lines: list[str], fmt: str = "jif") -> list
         is_on_prev_line = is_on_line
 
     entries = []
-    row = ""
+    parts: list[str] = []
 
     for line in lines[offset:-1]:
-        row = f"{row} {line}"
+        parts.append(line)
+        if not _LINE_END_2023_RE.search(line):
+            continue
+
+        row = " ".join(parts)
+        if not _INDEX_RE.search(row):
+            continue
 
-        new_entries = []
+        end = 0
         for match in _LINE_2023_RE.finditer(row):
-            new_entries.append(row2entry(match.groups()))
+            entries.append(row2entry(match.groups()))
+            end = match.end()
 
-        if new_entries:
-            row = ""
-            entries.extend(new_entries)
+        if end:
+            # NOTE: any text after the last match is the start of the next row
+            parts = [tail] if (tail := row[end:].strip()) else []
 
     if not entries:
         raise RuntimeError("No journals found on page")
@@ -241,3 +264,44 @@ def parse_2023_quartile_zone_entries(lines: list[str], fmt: str = "jif") -> list
 
 
 # }}}
+
+
+# {{{ parse_quartile_zone_pages
+
+
+def parse_quartile_zone_page(
+    page: pypdf.PageObject, *, version: int, fmt: str = "jif"
+) -> list[Entry]:
+    """Parse the journal entries from a single page of a quartile zone PDF."""
+    if version == 2024:
+        lines = [line.text for line in extract_text(page)]
+        return parse_2024_quartile_zone_entries(lines, fmt=fmt)
+    elif version == 2023:
+        lines = [
+            text for line in page.extract_text().split("\n") if (text := line.strip())
+        ]
+        return parse_2023_quartile_zone_entries(lines, fmt=fmt)
+    else:
+        raise ValueError(f"Unknown version '{version}'")
+
+
+def parse_quartile_zone_pages(
+    filename: pathlib.Path, pages: range, *, version: int, fmt: str = "jif"
+) -> list[list[Entry]]:
+    """Parse the journal entries from a range of pages of a quartile zone PDF.
+
+    The file is read by this function, so that it can be used as a worker
+    in a :class:`~concurrent.futures.ProcessPoolExecutor` without having to
+    pickle any :mod:`pypdf` objects.
+
+    :returns: a :class:`list` with the entries on each page in *pages*.
+    """
+    # NOTE: pypdf does a lot of small reads and seeks when extracting text, so
+    # it is faster to give it the whole file from memory
+    pdf = pypdf.PdfReader(io.BytesIO(filename.read_bytes()))
+    return [
+        parse_quartile_zone_page(pdf.pages[i], version=version, fmt=fmt) for i in pages
+    ]
+
+
+# }}}
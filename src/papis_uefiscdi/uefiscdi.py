@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import os
 import pathlib
+import sys
 import time
-from typing import Any, Callable, Iterator, TypedDict
+from functools import lru_cache
+from typing import IO, Any, Callable, Iterator, Sequence, TypedDict
 
 from papis_uefiscdi.logging import get_logger
 
@@ -13,6 +16,10 @@ log = get_logger(__name__)
 
 _SUPPORTED_VERSIONS = {2023, 2024}
 
+# NOTE: starting a worker process takes about as long as parsing a few dozen
+# pages, so smaller PDFs are not worth parsing in parallel
+_PARALLEL_MIN_PAGES_PER_WORKER = 32
+
 
 # {{{ utils
 
@@ -62,6 +69,109 @@ def stringify(entry: Entry, database: str) -> str:
     return f"[{database.upper()} {value}] {name} ({category})"
 
 
+@lru_cache(maxsize=8192)
+def titlecase(text: str) -> str:
+    """A cached version of :func:`titlecase.titlecase`.
+
+    Categories (and some journal names) are repeated many times in the
+    databases, so this avoids redoing the same work for each entry.
+    """
+    from titlecase import titlecase as _titlecase
+
+    result: str = _titlecase(text)
+    return result
+
+
+def _quartile_zone_sort_key(entry: Entry) -> tuple[Any, ...]:
+    # NOTE: journals without a quartile are placed last in their category
+    quartile = entry["quartile"]
+    return (
+        entry["index"],
+        entry["category"],
+        quartile if quartile is not None else "Q9",
+        entry["position"],
+    )
+
+
+def _parse_quartile_zone_pdf(
+    filename: pathlib.Path, *, version: int, fmt: str, parallel: bool
+) -> list[Entry]:
+    import io
+
+    import pypdf
+
+    from papis_uefiscdi.pdf import parse_quartile_zone_page, parse_quartile_zone_pages
+
+    t_start = time.time()
+
+    # NOTE: pypdf does a lot of small reads and seeks when extracting text, so
+    # it is faster to give it the whole file from memory
+    pdf = pypdf.PdfReader(io.BytesIO(filename.read_bytes()))
+    npages = len(pdf.pages)
+
+    nworkers = (
+        min(os.cpu_count() or 1, npages // _PARALLEL_MIN_PAGES_PER_WORKER)
+        if parallel
+        else 1
+    )
+    if nworkers > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        # NOTE: the pages are split into contiguous chunks, so that each worker
+        # only opens the file once. The 'spawn' context is used because the
+        # databases are also indexed from multiple threads (see `cli_index`)
+        # and forking a multi-threaded process is not safe.
+        chunksize = -(-npages // nworkers)
+        chunks = [
+            range(i, min(i + chunksize, npages)) for i in range(0, npages, chunksize)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=len(chunks),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            pages = [
+                journals
+                for chunk in executor.map(
+                    partial(
+                        parse_quartile_zone_pages, filename, version=version, fmt=fmt
+                    ),
+                    chunks,
+                )
+                for journals in chunk
+            ]
+    else:
+        pages = [
+            parse_quartile_zone_page(page, version=version, fmt=fmt)
+            for page in pdf.pages
+        ]
+
+    results: list[Entry] = []
+    for i, journals in enumerate(pages):
+        log.debug(
+            "Parsing page %4d / %4d. Extracted %d journals for a total of %d",
+            i + 1,
+            npages,
+            len(journals),
+            len(results) + len(journals),
+        )
+        results.extend(journals)
+    t_end = time.time()
+
+    log.info(
+        "Extracted %s for %d journals from %d pages (%.3fs)",
+        fmt.upper(),
+        len(results),
+        npages,
+        t_end - t_start,
+    )
+
+    results.sort(key=_quartile_zone_sort_key)
+    return results
+
+
 # }}}
 
 # {{{ Journal Impact Factor
@@ -73,7 +183,7 @@ def window(iterable: list[str]) -> Iterator[tuple[tuple[str, str], str]]:
 
 
 def parse_uefiscdi_journal_impact_factor_quartile(
-    filename: str | pathlib.Path, *, version: int = 2023
+    filename: str | pathlib.Path, *, version: int = 2023, parallel: bool = True
 ) -> list[Entry]:
     """Parse Journal Impact Factor (JIF) ranking data from the given filename.
 
@@ -81,6 +191,8 @@ def parse_uefiscdi_journal_impact_factor_quartile(
     parsing from PDFs is notoriously difficult, so this procedure is not
     exact. Additional heuristics and edge cases will be added in time.
 
+    :arg parallel: if *True*, the pages are parsed in parallel in separate
+        processes.
     :returns: a :class:`list` of journals ordered by index, category, quartile
         and the position in quartile.
     """
@@ -91,58 +203,8 @@ def parse_uefiscdi_journal_impact_factor_quartile(
     if version not in _SUPPORTED_VERSIONS:
         raise ValueError(f"Unknown version '{version}'")
 
-    import pypdf
-
-    from papis_uefiscdi.pdf import (
-        extract_text,
-        parse_2023_quartile_zone_entries,
-        parse_2024_quartile_zone_entries,
-    )
-
-    with open(filename, "rb") as f:
-        pdf = pypdf.PdfReader(f)
-
-        t_start = time.time()
-        results: list[Entry] = []
-        for i, page in enumerate(pdf.pages):
-            if version == 2024:
-                lines = [line.text for line in extract_text(page)]
-                journals = parse_2024_quartile_zone_entries(lines, fmt="jif")
-            elif version == 2023:
-                lines = [
-                    text
-                    for line in page.extract_text().split("\n")
-                    if (text := line.strip())
-                ]
-                journals = parse_2023_quartile_zone_entries(lines, fmt="jif")
-            else:
-                raise AssertionError
-
-            log.debug(
-                "Parsing page %4d / %4d. Extracted %d journals for a total of %d",
-                i + 1,
-                len(pdf.pages),
-                len(journals),
-                len(results) + len(journals),
-            )
-            results.extend(journals)
-        t_end = time.time()
-
-        log.info(
-            "Extracted JIF for %d journals from %d pages (%.3fs)",
-            len(results),
-            len(pdf.pages),
-            t_end - t_start,
-        )
-
-    return sorted(
-        results,
-        key=lambda j: (
-            j["index"],
-            j["category"],
-            j["quartile"] if j["quartile"] is not None else "Q9",
-            j["position"],
-        ),
+    return _parse_quartile_zone_pdf(
+        filename, version=version, fmt="jif", parallel=parallel
     )
 
 
@@ -153,7 +215,7 @@ def parse_uefiscdi_journal_impact_factor_quartile(
 
 
 def parse_uefiscdi_article_influence_score_quartile(
-    filename: str | pathlib.Path, *, version: int = 2023
+    filename: str | pathlib.Path, *, version: int = 2023, parallel: bool = True
 ) -> list[Entry]:
     """Parse Article Influence Score (AIS) ranking data from the given filename.
 
@@ -161,6 +223,8 @@ def parse_uefiscdi_article_influence_score_quartile(
     parsing from PDFs is notoriously difficult, so this procedure is not
     exact. Additional heuristics and edge cases will be added in time.
 
+    :arg parallel: if *True*, the pages are parsed in parallel in separate
+        processes.
     :returns: a :class:`list` of journals ordered by index, category, quartile
         and the position in quartile.
     """
@@ -171,58 +235,8 @@ def parse_uefiscdi_article_influence_score_quartile(
     if version not in _SUPPORTED_VERSIONS:
         raise ValueError(f"Unknown version '{version}'")
 
-    import pypdf
-
-    from papis_uefiscdi.pdf import (
-        extract_text,
-        parse_2023_quartile_zone_entries,
-        parse_2024_quartile_zone_entries,
-    )
-
-    with open(filename, "rb") as f:
-        pdf = pypdf.PdfReader(f)
-
-        t_start = time.time()
-        results: list[Entry] = []
-        for i, page in enumerate(pdf.pages):
-            if version == 2024:
-                lines = [line.text for line in extract_text(page)]
-                journals = parse_2024_quartile_zone_entries(lines, fmt="ais")
-            elif version == 2023:
-                lines = [
-                    text
-                    for line in page.extract_text().split("\n")
-                    if (text := line.strip())
-                ]
-                journals = parse_2023_quartile_zone_entries(lines, fmt="ais")
-            else:
-                raise AssertionError
-
-            log.debug(
-                "Parsing page %4d / %4d. Extracted %d journals for a total of %d",
-                i + 1,
-                len(pdf.pages),
-                len(journals),
-                len(results) + len(journals),
-            )
-            results.extend(journals)
-        t_end = time.time()
-
-        log.info(
-            "Extracted AIS for %d journals from %d pages (%.3fs)",
-            len(results),
-            len(pdf.pages),
-            t_end - t_start,
-        )
-
-    return sorted(
-        results,
-        key=lambda j: (
-            j["index"],
-            j["category"],
-            j["quartile"] if j["quartile"] is not None else "Q9",
-            j["position"],
-        ),
+    return _parse_quartile_zone_pdf(
+        filename, version=version, fmt="ais", parallel=parallel
     )
 
 
@@ -231,22 +245,25 @@ def parse_uefiscdi_article_influence_score_quartile(
 # {{{ Article Influence Score
 
 
-def _decrypt_file(filename: pathlib.Path, password: str) -> pathlib.Path:
-    import tempfile
+def _decrypt_file(filename: pathlib.Path, password: str) -> pathlib.Path | IO[bytes]:
+    import io
 
     import msoffcrypto
 
+    # NOTE: the decrypted workbook is kept in memory, since openpyxl can read it
+    # directly from there without a round-trip through a temporary file
+    outf = io.BytesIO()
     try:
-        with tempfile.NamedTemporaryFile(suffix=filename.suffix, delete=False) as outf:
-            with open(filename, "rb") as f:
-                msfile = msoffcrypto.OfficeFile(f)
-                msfile.load_key(password=password)
-                msfile.decrypt(outf)
-
-            return pathlib.Path(outf.name)
+        with open(filename, "rb") as f:
+            msfile = msoffcrypto.OfficeFile(f)
+            msfile.load_key(password=password)
+            msfile.decrypt(outf)
     except msoffcrypto.exceptions.DecryptionError:
         return filename
 
+    outf.seek(0)
+    return outf
+
 
 def _normalize_2024_ais_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
     journal, issn, eissn, category, index, score = row
@@ -257,8 +274,8 @@ def _normalize_2024_ais_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
 def _normalize_2023_ais_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
     journal, issn, eissn, category_index, score, quartile_value = row
 
-    category, index = str(category_index.value).split(" - ")
-    quartile = None if (q := str(quartile_value.value).upper()) == "N/A" else q
+    category, index = str(category_index).split(" - ")
+    quartile = None if (q := str(quartile_value).upper()) == "N/A" else sys.intern(q)
 
     return journal, issn, eissn, category, index, score, quartile
 
@@ -269,28 +286,33 @@ def _normalize_rif_ris_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
     return journal, issn, eissn, category, index, score, None
 
 
+def _normalize_issn(value: str | None) -> str | None:
+    if value is None:
+        return None
+
+    # NOTE: all ISSNs are of the form XXXX-XXXX, so we ignore others
+    issn = value.strip()
+    return issn.upper() if len(issn) == 9 else None
+
+
 def _parse_score_entries(
-    filename: pathlib.Path, getter: Callable[[tuple[Any, ...]], tuple[Any, ...]]
+    filename: pathlib.Path | IO[bytes],
+    getter: Callable[[tuple[Any, ...]], tuple[Any, ...]],
 ) -> list[Entry]:
     import openpyxl
 
+    # NOTE: `data_only=True` is not used, since formula cells without a cached
+    # value are then read as None, which would end the table early below
     wb = openpyxl.load_workbook(filename, read_only=True)
     if wb is None:
         log.error("Could not load workbook.")
         return []
 
-    rows = wb.active.rows  # type: ignore[union-attr]
-    _ = next(rows)
-
-    from titlecase import titlecase
+    # NOTE: the first row contains the table header
+    rows = wb.active.iter_rows(min_row=2, values_only=True)  # type: ignore[union-attr]
 
     def cell2str(row: tuple[Any, ...]) -> tuple[str | None, ...]:
-        result = []
-        for entry in row:
-            value = getattr(entry, "value", entry)
-            result.append(str(value) if value is not None else None)
-
-        return tuple(result)
+        return tuple(str(value) if value is not None else None for value in row)
 
     results: list[Entry] = []
     for row in rows:
@@ -303,58 +325,44 @@ def _parse_score_entries(
         except ValueError:
             scoref = None
 
-        issn = str(issn).strip().upper()
-        eissn = str(eissn).strip().upper()
-
-        results.append(
-            Entry(
-                category=titlecase(category.strip()) if category is not None else None,
-                index=index.strip().upper() if index is not None else None,
-                name=titlecase(journal.strip()) if journal is not None else None,
-                # NOTE: all ISSNs are of the form XXXX-XXX, so we ignore others
-                issn=None if len(issn) != 9 else issn,
-                eissn=None if len(eissn) != 9 else eissn,
-                quartile=quartile,
-                position=None,
-                score=scoref,
-            )
-        )
+        results.append({
+            "category": titlecase(category.strip()) if category is not None else None,
+            "index": sys.intern(index.strip().upper()) if index is not None else None,
+            "name": titlecase(journal.strip()) if journal is not None else None,
+            "issn": _normalize_issn(issn),
+            "eissn": _normalize_issn(eissn),
+            "quartile": quartile,
+            "position": None,
+            "score": scoref,
+        })
 
     return results
 
 
-def parse_uefiscdi_article_influence_score(
+def _parse_score_xlsx(
     filename: str | pathlib.Path,
     *,
-    version: int = 2023,
-    password: str | None = "uefiscdi",  # noqa: S107
+    fmt: str,
+    version: int,
+    password: str | None,
+    getters: dict[int, Callable[[tuple[Any, ...]], tuple[Any, ...]]],
 ) -> list[Entry]:
-    """Parse Article Influence Score (AIS) data from the given filename.
-
-    This data is usually given in the XLSX Excel format and can be easily
-    retrieved from the documents.
-
-    :arg password: password for the *filename*, if any, as given on the
-        `official website <https://uefiscdi.gov.ro/scientometrie-baze-de-date>`__.
-    """
     if version not in _SUPPORTED_VERSIONS:
         raise ValueError(f"Unknown version '{version}'")
 
-    decrypted_filename = pathlib.Path(filename)
+    filename = pathlib.Path(filename)
+
+    decrypted_filename: pathlib.Path | IO[bytes] = filename
     if password is not None:
-        decrypted_filename = _decrypt_file(decrypted_filename, password)
+        decrypted_filename = _decrypt_file(filename, password)
 
     t_start = time.time()
-    if version == 2024:
-        results = _parse_score_entries(decrypted_filename, _normalize_2024_ais_row)
-    elif version == 2023:
-        results = _parse_score_entries(decrypted_filename, _normalize_2023_ais_row)
-    else:
-        raise AssertionError
+    results = _parse_score_entries(decrypted_filename, getters[version])
     t_end = time.time()
 
     log.info(
-        "Extracted AIS for %d journals from '%s' (%.3fs)",
+        "Extracted %s for %d journals from '%s' (%.3fs)",
+        fmt.upper(),
         len(results),
         filename,
         t_end - t_start,
@@ -362,6 +370,29 @@ def parse_uefiscdi_article_influence_score(
     return results
 
 
+def parse_uefiscdi_article_influence_score(
+    filename: str | pathlib.Path,
+    *,
+    version: int = 2023,
+    password: str | None = "uefiscdi",  # noqa: S107
+) -> list[Entry]:
+    """Parse Article Influence Score (AIS) data from the given filename.
+
+    This data is usually given in the XLSX Excel format and can be easily
+    retrieved from the documents.
+
+    :arg password: password for the *filename*, if any, as given on the
+        `official website <https://uefiscdi.gov.ro/scientometrie-baze-de-date>`__.
+    """
+    return _parse_score_xlsx(
+        filename,
+        fmt="ais",
+        version=version,
+        password=password,
+        getters={2023: _normalize_2023_ais_row, 2024: _normalize_2024_ais_row},
+    )
+
+
 # }}}
 
 # {{{ Relative Influence Score
@@ -381,29 +412,13 @@ def parse_uefiscdi_relative_influence_score(
     :arg password: password for the *filename*, if any, as given on the
         `official website <https://uefiscdi.gov.ro/scientometrie-baze-de-date>`__.
     """
-    if version not in _SUPPORTED_VERSIONS:
-        raise ValueError(f"Unknown version '{version}'")
-
-    decrypted_filename = pathlib.Path(filename)
-    if password is not None:
-        decrypted_filename = _decrypt_file(decrypted_filename, password)
-
-    t_start = time.time()
-    if version == 2024:  # noqa: SIM114
-        results = _parse_score_entries(decrypted_filename, _normalize_rif_ris_row)
-    elif version == 2023:
-        results = _parse_score_entries(decrypted_filename, _normalize_rif_ris_row)
-    else:
-        raise AssertionError
-    t_end = time.time()
-
-    log.info(
-        "Extracted RIS for %d journals from '%s' (%.3fs)",
-        len(results),
+    return _parse_score_xlsx(
         filename,
-        t_end - t_start,
+        fmt="ris",
+        version=version,
+        password=password,
+        getters={2023: _normalize_rif_ris_row, 2024: _normalize_rif_ris_row},
     )
-    return results
 
 
 # }}}
@@ -425,29 +440,13 @@ def parse_uefiscdi_relative_impact_factor(
     :arg password: password for the *filename*, if any, as given on the
         `official website <https://uefiscdi.gov.ro/scientometrie-baze-de-date>`__.
     """
-    if version not in _SUPPORTED_VERSIONS:
-        raise ValueError(f"Unknown version '{version}'")
-
-    decrypted_filename = pathlib.Path(filename)
-    if password is not None:
-        decrypted_filename = _decrypt_file(decrypted_filename, password)
-
-    t_start = time.time()
-    if version == 2024:  # noqa: SIM114
-        results = _parse_score_entries(decrypted_filename, _normalize_rif_ris_row)
-    elif version == 2023:
-        results = _parse_score_entries(decrypted_filename, _normalize_rif_ris_row)
-    else:
-        raise AssertionError
-    t_end = time.time()
-
-    log.info(
-        "Extracted RIF for %d journals from '%s' (%.3fs)",
-        len(results),
+    return _parse_score_xlsx(
         filename,
-        t_end - t_start,
+        fmt="rif",
+        version=version,
+        password=password,
+        getters={2023: _normalize_rif_ris_row, 2024: _normalize_rif_ris_row},
     )
-    return results
 
 
 # }}}
@@ -463,8 +462,8 @@ class Database(TypedDict):
     """The version (year of release) of the database."""
     url: str
     """The URL (or filename) it was parsed from."""
-    entries: list[Entry]
-    """A list of parsed journal entries."""
+    entries: Sequence[Entry]
+    """A sequence of parsed journal entries."""
 
 
 def parse_uefiscdi_database_from_url(
@@ -473,6 +472,7 @@ def parse_uefiscdi_database_from_url(
     *,
     version: int | None = None,
     password: str | None = None,
+    parallel: bool = True,
 ) -> Database:
     from papis_uefiscdi.config import UEFISCDI_DATABASE_URL, UEFISCDI_DEFAULT_PASSWORD
 
@@ -520,11 +520,11 @@ def parse_uefiscdi_database_from_url(
     entries: list[Entry]
     if database == "aisq":
         entries = parse_uefiscdi_article_influence_score_quartile(
-            filename, version=version
+            filename, version=version, parallel=parallel
         )
     elif database == "jifq":
         entries = parse_uefiscdi_journal_impact_factor_quartile(
-            filename, version=version
+            filename, version=version, parallel=parallel
         )
     elif database == "ais":
         entries = parse_uefiscdi_article_influence_score(
@@ -29,6 +29,10 @@ def get_session() -> requests.Session:
         return requests.Session()
 
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+"""Size (in bytes) of the chunks used to stream downloaded documents to disk."""
+
+
 def download_document(
     url: str,
     *,
@@ -42,6 +46,9 @@ def download_document(
     If this is not possible, a temporary file is created instead. To ensure that
     the desired filename is chosen, provide the *filename* argument instead.
 
+    The document is streamed to the file in chunks of :data:`DOWNLOAD_CHUNK_SIZE`,
+    so that large files are never held in memory in their entirety.
+
     :param url: the URL of a remote file.
     :param expected_document_extension: an expected file extension. If *None*, then
         an extension is guessed from the file contents or from the *filename*.
@@ -54,12 +61,27 @@ def download_document(
         cookies = {}
 
     try:
-        with get_session() as session:
-            response = session.get(url, cookies=cookies, allow_redirects=True)
+        with get_session() as session, session.get(
+            url, cookies=cookies, allow_redirects=True, stream=True
+        ) as response:
+            return _save_response(
+                url,
+                response,
+                expected_document_extension=expected_document_extension,
+                filename=filename,
+            )
     except Exception as exc:
         log.error("Failed to fetch '%s'.", url, exc_info=exc)
         return None
 
+
+def _save_response(
+    url: str,
+    response: requests.Response,
+    *,
+    expected_document_extension: str | None = None,
+    filename: str | None = None,
+) -> pathlib.Path | None:
     if not response.ok:
         log.error(
             "Could not download document '%s'. (HTTP status: %s %d).",
@@ -122,14 +144,36 @@ def download_document(
         root, _ = os.path.splitext(os.path.basename(filename))
         outfile = os.path.join(tempfile.gettempdir(), f"{root}{ext}")
 
-        with open(outfile, mode="wb") as f:
-            f.write(response.content)
+        # NOTE: the same document can be downloaded concurrently (e.g. the AIS
+        # and JIF quartiles are in the same file), so write it to a temporary
+        # file that is unique to this thread and atomically move it in place
+        import threading
+
+        tmpfile = f"{outfile}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            with open(tmpfile, mode="wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+            os.replace(tmpfile, outfile)
+        except BaseException:
+            if os.path.exists(tmpfile):
+                os.unlink(tmpfile)
+            raise
     else:
         with tempfile.NamedTemporaryFile(
             mode="wb+", suffix=f"{ext}", delete=False
         ) as f:
-            f.write(response.content)
             outfile = f.name
+            try:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+            except BaseException:
+                # NOTE: remove the partially written file, since it is not
+                # deleted automatically
+                f.close()
+                os.unlink(outfile)
+                raise
 
     return pathlib.Path(outfile)
 
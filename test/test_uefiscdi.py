@@ -90,6 +90,185 @@ def test_parse_score_data(
         writer.writerows(result)
 
 
+def test_parse_zone_rows_2023() -> None:
+    from papis_uefiscdi.pdf import parse_2023_quartile_zone_entries
+
+    lines = [
+        "Web of Science Category-Index Revista ISSN eISSN",
+        "Q JIF 2022 (conform JCR iunie 2023) Loc in zona/Q JIF",
+        "MATHEMATICS - SCIE ACTA MATHEMATICA 0001-5962 1871-2509 Q1 1",
+        "MATHEMATICS, APPLIED - SCIE JOURNAL OF",
+        "COMPUTATIONAL PHYSICS 0021-9991 1090-2716 Q1 2",
+        # NOTE: the next row starts at the end of this line
+        "MATHEMATICS, APPLIED - SCIE SIAM REVIEW 0036-1445 N/A Q2 3 MATHEMATICS - ESCI",
+        "SOME JOURNAL N/A 1234-567X Q4 7",
+        "footer",
+    ]
+
+    result = parse_2023_quartile_zone_entries(lines, fmt="jif")
+    assert [(e["category"], e["index"], e["name"]) for e in result] == [
+        ("Mathematics", "SCIE", "Acta Mathematica"),
+        ("Mathematics, Applied", "SCIE", "Journal of Computational Physics"),
+        ("Mathematics, Applied", "SCIE", "Siam Review"),
+        ("Mathematics", "ESCI", "Some Journal"),
+    ]
+    assert [e["eissn"] for e in result] == ["1871-2509", "1090-2716", None, "1234-567X"]
+
+
+def test_parse_zone_rows_2024() -> None:
+    from papis_uefiscdi.pdf import parse_2024_quartile_zone_entries
+
+    lines = [
+        "Journal name ISSN eISSN Category Edition JIF Quartile AIS Quartile",
+        "ACTA MATHEMATICA 0001-5962 1871-2509 MATHEMATICS SCIE Q1 Q1",
+        "JOURNAL OF COMPUTATIONAL",
+        "PHYSICS 0021-9991 1090-2716 PHYSICS, MATHEMATICAL SCIE Q1 Q2",
+        # NOTE: the next row starts at the end of this line
+        "SIAM REVIEW 0036-1445 N/A MATHEMATICS, APPLIED SCIE Q2 N/A NATURE",
+        "0028-0836 1476-4687 MULTIDISCIPLINARY SCIENCES SCIE Q1 Q1",
+        "footer",
+    ]
+
+    result = parse_2024_quartile_zone_entries(lines, fmt="ais")
+    assert [(e["name"], e["quartile"]) for e in result] == [
+        ("Acta Mathematica", "Q1"),
+        ("Journal of Computational Physics", "Q2"),
+        ("Siam Review", None),
+        ("Nature", "Q1"),
+    ]
+
+
+def _write_database(database: str, version: int) -> list[str]:
+    import json
+
+    from papis_uefiscdi.command import get_uefiscdi_database_path
+
+    def entry(
+        name: str, category: str, index: str, quartile: str | None
+    ) -> uefiscdi.Entry:
+        return {
+            "category": category,
+            "index": index,
+            "name": name,
+            "issn": None,
+            "eissn": None,
+            "quartile": quartile,
+            "position": None,
+            "score": None,
+        }
+
+    entries = [
+        entry("Acta Mathematica", "Mathematics", "SCIE", "Q1"),
+        entry("Some Journal", "Mathematics, Applied", "ESCI", "Q3"),
+        entry("Physical Review", "Physics", "SCIE", "Q2"),
+        entry("Applied Physics", "Physics, Applied", "SCIE", None),
+    ]
+
+    filename = get_uefiscdi_database_path(database, version)
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    with open(filename, "w", encoding="utf-8") as outf:
+        json.dump(
+            {"id": database, "version": version, "url": "", "entries": entries}, outf
+        )
+
+    return [name for e in entries if (name := e["name"]) is not None]
+
+
+def test_load_database(tmp_config: TemporaryConfiguration) -> None:
+    from papis_uefiscdi.command import load_uefiscdi_database
+
+    names = _write_database("aisq", 2024)
+
+    # NOTE: the loaded databases are cached, so modifying the result of one
+    # load should not affect any of the other loads
+    db = load_uefiscdi_database("aisq", 2024)
+    assert [e["name"] for e in db["entries"]] == names
+
+    with pytest.raises(AttributeError):
+        db["entries"].append(db["entries"][0])  # type: ignore[attr-defined]
+    db["entries"] = []
+
+    db = load_uefiscdi_database("aisq", 2024)
+    assert [e["name"] for e in db["entries"]] == names
+
+
+def test_search_filters(
+    tmp_config: TemporaryConfiguration, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import json
+
+    import click.testing
+
+    from papis_uefiscdi.command import cli
+
+    _write_database("aisq", 2024)
+
+    # NOTE: skip the interactive picker and just return all the documents
+    monkeypatch.setattr("papis.pick.pick_doc", lambda docs: docs)
+
+    def search(*args: str) -> list[str]:
+        result = click.testing.CliRunner().invoke(
+            cli,
+            ["search", "--database", "aisq", "--year", "2024", *args],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        return sorted(e["name"] for e in json.loads(result.stdout))
+
+    assert search() == [
+        "Acta Mathematica",
+        "Applied Physics",
+        "Physical Review",
+        "Some Journal",
+    ]
+    assert search("--category", "MATH") == ["Acta Mathematica", "Some Journal"]
+    assert search("--category", "applied", "--index", "scie") == ["Applied Physics"]
+    assert search("--index", "ESCI") == ["Some Journal"]
+    # NOTE: journals without a quartile are not filtered out
+    assert search("--quartile", "2") == [
+        "Acta Mathematica",
+        "Applied Physics",
+        "Physical Review",
+    ]
+
+    result = click.testing.CliRunner().invoke(cli, ["search", "--quartile", "5"])
+    assert result.exit_code != 0
+
+
+def test_search_query(
+    tmp_config: TemporaryConfiguration, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import json
+
+    import click.testing
+
+    from papis_uefiscdi.command import cli
+
+    _write_database("aisq", 2024)
+
+    # NOTE: skip the interactive picker and just return all the documents
+    monkeypatch.setattr("papis.pick.pick_doc", lambda docs: docs)
+
+    def search(query: str) -> list[str]:
+        result = click.testing.CliRunner().invoke(
+            cli,
+            ["search", "--database", "aisq", "--year", "2024", query],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0
+        return sorted(e["name"] for e in json.loads(result.stdout))
+
+    # NOTE: plain queries are matched against the journal name, category and index
+    assert search("acta") == ["Acta Mathematica"]
+    assert search("physics") == ["Applied Physics", "Physical Review"]
+    assert search("ESCI") == ["Some Journal"]
+
+    # NOTE: other fields are not part of the match format and need a key
+    assert search("Q1") == []
+    assert search("quartile:Q1") == ["Acta Mathematica"]
+    assert search("name:review") == ["Physical Review"]
+
+
 if __name__ == "__main__":
     import sys
 